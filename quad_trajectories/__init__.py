@@ -36,10 +36,10 @@ Using Utility Functions:
 """
 
 # Types
-from .types import TrajContext, TrajectoryType
+from .types import TrajContext, TrajStaticCtx, TrajDynamicCtx, TrajectoryType
 
 # Registry
-from .registry import TRAJ_REGISTRY, TrajectoryFunc
+from .registry import TRAJ_REGISTRY, TrajectoryFunc, CompiledTrajectory, bind_ctx, build_compiled_registry
 
 # Individual trajectory functions (for direct import if needed)
 from .core import (
@@ -68,6 +68,9 @@ from .utils import (
     get_pos_vel_fn,
     generate_horizon_positions,
     generate_horizon_with_velocity,
+    generate_horizon_positions_scan,
+    generate_horizon_with_velocity_scan,
+    generate_horizon_batch,
     generate_reference_trajectory,
     GRAVITY,
     flat_to_x_u,
@@ -76,15 +79,20 @@ from .utils import (
 )
 
 # JAX utilities
-from .jax_utils import jit
+from .jax_utils import jit, FLOAT_DTYPE
 
 __all__ = [
     # Types
     "TrajContext",
+    "TrajStaticCtx",
+    "TrajDynamicCtx",
     "TrajectoryType",
     "TrajectoryFunc",
     # Registry
     "TRAJ_REGISTRY",
+    "CompiledTrajectory",
+    "bind_ctx",
+    "build_compiled_registry",
     # Trajectory functions
     "hover",
     "hover_contraction",
@@ -110,9 +118,13 @@ __all__ = [
     "get_pos_vel_fn",
     "generate_horizon_positions",
     "generate_horizon_with_velocity",
+    "generate_horizon_positions_scan",
+    "generate_horizon_with_velocity_scan",
+    "generate_horizon_batch",
     "generate_reference_trajectory",
     "flat_to_x_u",
     "flat_to_x",
     "generate_feedforward_trajectory",
     "jit",
+    "FLOAT_DTYPE",
 ]
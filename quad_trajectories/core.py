@@ -28,14 +28,59 @@ Example Usage in Controller:
     accel = jacfwd(jacfwd(lambda t: traj_fn(t, ctx)))(t)
 """
 
+import math
+from functools import partial
+
+import jax
 import jax.numpy as jnp
-from .jax_utils import jit
+from .jax_utils import jit, FLOAT_DTYPE
 from .types import TrajContext
 
 # Default heights
 SIM_HEIGHT = 3.0
 HARDWARE_HEIGHT = 0.85
 
+# Angular rates precomputed as Python floats, so each trace inlines a single
+# HLO constant instead of re-deriving 2*pi/period behind a double_speed
+# branch. _OMEGA_POS_13 is keyed by the double_speed flag.
+_OMEGA_POS_13 = {False: 2 * math.pi / 13.0, True: 2 * math.pi / 6.5}
+_OMEGA_SPIN_10 = 2 * math.pi / 10.0
+_OMEGA_SPIN_20 = 2 * math.pi / 20.0
+_OMEGA_SPIN_30 = 2 * math.pi / 30.0
+_OMEGA_SPIN_35 = 2 * math.pi / 35.0
+
+
+def _pack(x, y, z, yaw) -> jnp.ndarray:
+    """Stacks four components into an [x, y, z, yaw] array along the last axis.
+
+    A single stack lowers to one XLA primitive, keeping the jaxpr (and its
+    autodiff tangent graph) smaller than a per-component array build. The
+    components are broadcast against each other, so trajectory bodies built
+    from elementwise ops accept a batched t and return shape (..., 4)
+    without needing vmap.
+    """
+    x, y, z, yaw = jnp.broadcast_arrays(
+        jnp.asarray(x, dtype=FLOAT_DTYPE),
+        jnp.asarray(y, dtype=FLOAT_DTYPE),
+        jnp.asarray(z, dtype=FLOAT_DTYPE),
+        jnp.asarray(yaw, dtype=FLOAT_DTYPE),
+    )
+    return jnp.stack([x, y, z, yaw], axis=-1)
+
+
+# Hover positions indexed by (hover_mode - 1). Built once at import so each
+# trace of hover() embeds a single constant row instead of eight fresh arrays.
+_HOVER_TABLE = jnp.array([
+    [0.0, 0.0, -0.9, 0.0],
+    [0.0, 0.8, -0.9, 0.0],
+    [0.8, 0.0, -0.8, 0.0],
+    [0.8, 0.8, -0.8, 0.0],
+    [0.0, 0.0, -10.0, 0.0],
+    [1.0, 1.0, -4.0, 0.0],
+    [0.0, 10.0, -5.0, 0.0],
+    [1.0, 1.0, -3.0, 0.0],
+], dtype=FLOAT_DTYPE)
+
 
 @jit(static_argnames=("ctx",))
 def hover(t: float, ctx: TrajContext) -> jnp.ndarray:
@@ -48,34 +93,16 @@ def hover(t: float, ctx: TrajContext) -> jnp.ndarray:
     Returns:
         Position array [x, y, z, yaw]
     """
+    # hover_mode was validated in TrajContext.__post_init__; mode is static,
+    # so XLA constant-folds this to a single 4-vector load. Broadcasting
+    # against t keeps the batched-time interface of the moving trajectories.
     mode = ctx.hover_mode if ctx.hover_mode is not None else 1
-    sim = ctx.sim
-
-    hover_dict = {
-        1: jnp.array([0.0, 0.0, -0.9, 0.0]),
-        2: jnp.array([0.0, 0.8, -0.9, 0.0]),
-        3: jnp.array([0.8, 0.0, -0.8, 0.0]),
-        4: jnp.array([0.8, 0.8, -0.8, 0.0]),
-        5: jnp.array([0.0, 0.0, -10.0, 0.0]),
-        6: jnp.array([1.0, 1.0, -4.0, 0.0]),
-        7: jnp.array([0.0, 10.0, -5.0, 0.0]),
-        8: jnp.array([1.0, 1.0, -3.0, 0.0]),
-    }
-
-    if mode not in hover_dict:
-        raise ValueError(f"hover_dict #{mode} not found")
-
-    if not sim and mode > 4:
-        raise RuntimeError("hover modes 5+ not available for hardware")
-
-    return hover_dict[mode]
+    return jnp.broadcast_to(_HOVER_TABLE[mode - 1], jnp.shape(t) + (4,))
 
 
 @jit(static_argnames=("ctx",))
 def hover_contraction(t: float, ctx: TrajContext) -> jnp.ndarray:
     """Returns the legacy contraction-workspace hover positions."""
-    del t
-
     height = SIM_HEIGHT if ctx.sim else HARDWARE_HEIGHT
     mode = ctx.hover_mode if ctx.hover_mode is not None else 1
 
@@ -90,17 +117,12 @@ def hover_contraction(t: float, ctx: TrajContext) -> jnp.ndarray:
         8: jnp.array([1.0, 1.0, -3.0, 0.0]),
     }
 
-    if mode not in hover_dict:
-        raise ValueError(f"hover_dict #{mode} not found")
-
-    if not ctx.sim and mode > 4:
-        raise RuntimeError("hover modes 5+ not available for hardware")
-
-    return hover_dict[mode]
+    # hover_mode was validated in TrajContext.__post_init__.
+    return jnp.broadcast_to(hover_dict[mode], jnp.shape(t) + (4,))
 
 
-@jit(static_argnames=("ctx",))
-def yaw_only(t: float, ctx: TrajContext) -> jnp.ndarray:
+@partial(jax.custom_jvp, nondiff_argnums=(1,))
+def _yaw_only(t: float, ctx: TrajContext) -> jnp.ndarray:
     """Returns stationary position with yawing motion.
 
     Args:
@@ -111,21 +133,29 @@ def yaw_only(t: float, ctx: TrajContext) -> jnp.ndarray:
         Position array [x, y, z, yaw]
     """
     height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
-    spin_period = 20.0
-
-    if ctx.double_speed:
-        spin_period /= 2.0
+    omega = _OMEGA_SPIN_10 if ctx.double_speed else _OMEGA_SPIN_20
 
     x = 0.0
     y = 0.0
     z = -height
-    yaw = t / (spin_period / (2 * jnp.pi))
+    yaw = omega * t
 
-    return jnp.array([x, y, z, yaw], dtype=jnp.float64)
+    return _pack(x, y, z, yaw)
 
 
-@jit(static_argnames=("ctx",))
-def circle_horizontal(t: float, ctx: TrajContext) -> jnp.ndarray:
+@_yaw_only.defjvp
+def _yaw_only_jvp(ctx, primals, tangents):
+    """Analytic tangent for yaw_only: only the yaw component moves."""
+    (t,), (t_dot,) = primals, tangents
+    omega = _OMEGA_SPIN_10 if ctx.double_speed else _OMEGA_SPIN_20
+    return _yaw_only(t, ctx), _pack(0.0 * t_dot, 0.0 * t_dot, 0.0 * t_dot, omega * t_dot)
+
+
+yaw_only = jit(_yaw_only, static_argnames=("ctx",))
+
+
+@partial(jax.custom_jvp, nondiff_argnums=(1,))
+def _circle_horizontal(t: float, ctx: TrajContext) -> jnp.ndarray:
     """Returns horizontal circle trajectory position.
 
     Args:
@@ -136,25 +166,43 @@ def circle_horizontal(t: float, ctx: TrajContext) -> jnp.ndarray:
         Position array [x, y, z, yaw]
     """
     radius = 0.6
-    period_pos = 13.0
     height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
-    period_spin = 20.0
 
-    omega_spin = 2 * jnp.pi / period_spin if ctx.spin else 0.0
-    if ctx.double_speed:
-        period_pos /= 2.0
-    omega_pos = 2 * jnp.pi / period_pos
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
+    omega_pos = _OMEGA_POS_13[bool(ctx.double_speed)]
 
     x = radius * jnp.cos(omega_pos * t)
     y = radius * jnp.sin(omega_pos * t)
     z = -height
     yaw = omega_spin * t
 
-    return jnp.array([x, y, z, yaw], dtype=jnp.float64)
+    return _pack(x, y, z, yaw)
 
 
-@jit(static_argnames=("ctx",))
-def circle_vertical(t: float, ctx: TrajContext) -> jnp.ndarray:
+@_circle_horizontal.defjvp
+def _circle_horizontal_jvp(ctx, primals, tangents):
+    """Analytic tangent for circle_horizontal, sharing sin/cos with the primal."""
+    (t,), (t_dot,) = primals, tangents
+    radius = 0.6
+    height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
+    omega_pos = _OMEGA_POS_13[bool(ctx.double_speed)]
+
+    c = jnp.cos(omega_pos * t)
+    s = jnp.sin(omega_pos * t)
+    pos = _pack(radius * c, radius * s, -height, omega_spin * t)
+    vel = _pack(-radius * omega_pos * s * t_dot,
+                radius * omega_pos * c * t_dot,
+                0.0 * t_dot,
+                omega_spin * t_dot)
+    return pos, vel
+
+
+circle_horizontal = jit(_circle_horizontal, static_argnames=("ctx",))
+
+
+@partial(jax.custom_jvp, nondiff_argnums=(1,))
+def _circle_vertical(t: float, ctx: TrajContext) -> jnp.ndarray:
     """Returns vertical circle trajectory position.
 
     Args:
@@ -165,25 +213,43 @@ def circle_vertical(t: float, ctx: TrajContext) -> jnp.ndarray:
         Position array [x, y, z, yaw]
     """
     radius = 0.35
-    period_pos = 13.0
     height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
-    period_spin = 20.0
 
-    omega_spin = 2 * jnp.pi / period_spin if ctx.spin else 0.0
-    if ctx.double_speed:
-        period_pos /= 2.0
-    omega_pos = 2 * jnp.pi / period_pos
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
+    omega_pos = _OMEGA_POS_13[bool(ctx.double_speed)]
 
     x = radius * jnp.cos(omega_pos * t)
     y = 0.0
     z = -radius * jnp.sin(omega_pos * t) - height
     yaw = omega_spin * t
 
-    return jnp.array([x, y, z, yaw], dtype=jnp.float64)
+    return _pack(x, y, z, yaw)
 
 
-@jit(static_argnames=("ctx",))
-def fig8_horizontal(t: float, ctx: TrajContext) -> jnp.ndarray:
+@_circle_vertical.defjvp
+def _circle_vertical_jvp(ctx, primals, tangents):
+    """Analytic tangent for circle_vertical, sharing sin/cos with the primal."""
+    (t,), (t_dot,) = primals, tangents
+    radius = 0.35
+    height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
+    omega_pos = _OMEGA_POS_13[bool(ctx.double_speed)]
+
+    c = jnp.cos(omega_pos * t)
+    s = jnp.sin(omega_pos * t)
+    pos = _pack(radius * c, 0.0, -radius * s - height, omega_spin * t)
+    vel = _pack(-radius * omega_pos * s * t_dot,
+                0.0 * t_dot,
+                -radius * omega_pos * c * t_dot,
+                omega_spin * t_dot)
+    return pos, vel
+
+
+circle_vertical = jit(_circle_vertical, static_argnames=("ctx",))
+
+
+@partial(jax.custom_jvp, nondiff_argnums=(1,))
+def _fig8_horizontal(t: float, ctx: TrajContext) -> jnp.ndarray:
     """Returns horizontal figure-8 trajectory position.
 
     Args:
@@ -194,25 +260,44 @@ def fig8_horizontal(t: float, ctx: TrajContext) -> jnp.ndarray:
         Position array [x, y, z, yaw]
     """
     radius = 0.35
-    period_pos = 13.0
     height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
-    period_spin = 20.0
 
-    omega_spin = 2 * jnp.pi / period_spin if ctx.spin else 0.0
-    if ctx.double_speed:
-        period_pos /= 2.0
-    omega_pos = 2 * jnp.pi / period_pos
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
+    omega_pos = _OMEGA_POS_13[bool(ctx.double_speed)]
 
     x = radius * jnp.sin(2 * omega_pos * t)
     y = radius * jnp.sin(omega_pos * t)
     z = -height
     yaw = omega_spin * t
 
-    return jnp.array([x, y, z, yaw], dtype=jnp.float64)
+    return _pack(x, y, z, yaw)
 
 
-@jit(static_argnames=("ctx",))
-def fig8_vertical(t: float, ctx: TrajContext) -> jnp.ndarray:
+@_fig8_horizontal.defjvp
+def _fig8_horizontal_jvp(ctx, primals, tangents):
+    """Analytic tangent for fig8_horizontal."""
+    (t,), (t_dot,) = primals, tangents
+    radius = 0.35
+    height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
+    omega_pos = _OMEGA_POS_13[bool(ctx.double_speed)]
+
+    pos = _pack(radius * jnp.sin(2 * omega_pos * t),
+                radius * jnp.sin(omega_pos * t),
+                -height,
+                omega_spin * t)
+    vel = _pack(2 * radius * omega_pos * jnp.cos(2 * omega_pos * t) * t_dot,
+                radius * omega_pos * jnp.cos(omega_pos * t) * t_dot,
+                0.0 * t_dot,
+                omega_spin * t_dot)
+    return pos, vel
+
+
+fig8_horizontal = jit(_fig8_horizontal, static_argnames=("ctx",))
+
+
+@partial(jax.custom_jvp, nondiff_argnums=(1,))
+def _fig8_vertical(t: float, ctx: TrajContext) -> jnp.ndarray:
     """Returns vertical figure-8 trajectory position.
 
     Args:
@@ -223,29 +308,56 @@ def fig8_vertical(t: float, ctx: TrajContext) -> jnp.ndarray:
         Position array [x, y, z, yaw]
     """
     radius = 0.35
-    period_pos = 13.0
     height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
-    period_spin = 20.0
 
-    omega_spin = 2 * jnp.pi / period_spin if ctx.spin else 0.0
-    if ctx.double_speed:
-        period_pos /= 2.0
-    omega_pos = 2 * jnp.pi / period_pos
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
+    omega_pos = _OMEGA_POS_13[bool(ctx.double_speed)]
 
     x = 0.0
 
+    # short is static, so only the selected variant is ever traced — no
+    # jnp.where materializing both sine pairs.
     yz1 = radius * jnp.sin(omega_pos * t)
     yz2 = radius * jnp.sin(2 * omega_pos * t)
-    y = jnp.where(ctx.short, yz1, yz2)  # type: ignore
-    z = jnp.where(ctx.short, -yz2 - height, -yz1 - height)  # type: ignore
+    if ctx.short:
+        y, z = yz1, -yz2 - height
+    else:
+        y, z = yz2, -yz1 - height
 
     yaw = omega_spin * t
 
-    return jnp.array([x, y, z, yaw], dtype=jnp.float64)
+    return _pack(x, y, z, yaw)
 
 
-@jit(static_argnames=("ctx",))
-def helix(t: float, ctx: TrajContext) -> jnp.ndarray:
+@_fig8_vertical.defjvp
+def _fig8_vertical_jvp(ctx, primals, tangents):
+    """Analytic tangent for fig8_vertical, selecting the short/long variant."""
+    (t,), (t_dot,) = primals, tangents
+    radius = 0.35
+    height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
+    omega_pos = _OMEGA_POS_13[bool(ctx.double_speed)]
+
+    yz1 = radius * jnp.sin(omega_pos * t)
+    yz2 = radius * jnp.sin(2 * omega_pos * t)
+    dyz1 = radius * omega_pos * jnp.cos(omega_pos * t)
+    dyz2 = 2 * radius * omega_pos * jnp.cos(2 * omega_pos * t)
+
+    if ctx.short:
+        y, z, dy, dz = yz1, -yz2 - height, dyz1, -dyz2
+    else:
+        y, z, dy, dz = yz2, -yz1 - height, dyz2, -dyz1
+
+    pos = _pack(0.0, y, z, omega_spin * t)
+    vel = _pack(0.0 * t_dot, dy * t_dot, dz * t_dot, omega_spin * t_dot)
+    return pos, vel
+
+
+fig8_vertical = jit(_fig8_vertical, static_argnames=("ctx",))
+
+
+@partial(jax.custom_jvp, nondiff_argnums=(1,))
+def _helix(t: float, ctx: TrajContext) -> jnp.ndarray:
     """Returns helix trajectory position (spirals up and down).
 
     Args:
@@ -260,9 +372,8 @@ def helix(t: float, ctx: TrajContext) -> jnp.ndarray:
     radius = 0.6
     num_turns = 3
     cycle_time = 50.0
-    period_spin = 35.0
 
-    omega_spin = 2 * jnp.pi / period_spin if ctx.spin else 0.0
+    omega_spin = _OMEGA_SPIN_35 if ctx.spin else 0.0
 
     if ctx.double_speed:
         cycle_time /= 2.0
@@ -270,19 +381,12 @@ def helix(t: float, ctx: TrajContext) -> jnp.ndarray:
     t_cycle = t % cycle_time
     T_half = cycle_time / 2.0
 
-    # Use jnp.where for differentiability instead of if/else
-    # Going up branch
-    z_up = z0 + (z_max - z0) * (t_cycle / T_half)
-    progress_up = (z_up - z0) / (z_max - z0)
-
-    # Going down branch
-    t_down = t_cycle - T_half
-    z_down = z_max - (z_max - z0) * (t_down / T_half)
-    progress_down = (z_down - z0) / (z_max - z0)
-
-    # Select based on condition using jnp.where for differentiability
-    z = jnp.where(t_cycle <= T_half, z_up, z_down)
-    progress = jnp.where(t_cycle <= T_half, progress_up, progress_down)
+    # Fold the descent half back onto the ascent: both branches are the same
+    # ramp evaluated at a mirrored time, so a single jnp.where on the time
+    # replaces the two z/progress selects (and halves the tangent graph).
+    base_t = jnp.where(t_cycle <= T_half, t_cycle, cycle_time - t_cycle)
+    progress = base_t / T_half
+    z = z0 + (z_max - z0) * progress
 
     # Angle is based on progress through the cycle
     theta = 2 * jnp.pi * num_turns * progress
@@ -290,11 +394,59 @@ def helix(t: float, ctx: TrajContext) -> jnp.ndarray:
     y = radius * jnp.sin(theta)
     yaw = omega_spin * t
 
-    return jnp.array([x, y, -z, yaw], dtype=jnp.float64)
+    return _pack(x, y, -z, yaw)
 
 
-@jit(static_argnames=("ctx",))
-def sawtooth(t: float, ctx: TrajContext) -> jnp.ndarray:
+@_helix.defjvp
+def _helix_jvp(ctx, primals, tangents):
+    """Analytic tangent for helix: climb rate flips sign on the descent half."""
+    (t,), (t_dot,) = primals, tangents
+    z0 = HARDWARE_HEIGHT if not ctx.sim else 2.0
+    z_max = 2.6 if not ctx.sim else SIM_HEIGHT
+    radius = 0.6
+    num_turns = 3
+    cycle_time = 25.0 if ctx.double_speed else 50.0
+    omega_spin = _OMEGA_SPIN_35 if ctx.spin else 0.0
+
+    t_cycle = t % cycle_time
+    T_half = cycle_time / 2.0
+    delta = z_max - z0
+
+    on_ascent = t_cycle <= T_half
+    base_t = jnp.where(on_ascent, t_cycle, cycle_time - t_cycle)
+    sign = jnp.where(on_ascent, 1.0, -1.0)
+
+    progress = base_t / T_half
+    z = z0 + delta * progress
+    theta = 2 * jnp.pi * num_turns * progress
+    dtheta = 2 * jnp.pi * num_turns * sign / T_half
+
+    c = jnp.cos(theta)
+    s = jnp.sin(theta)
+    pos = _pack(radius * c, radius * s, -z, omega_spin * t)
+    vel = _pack(-radius * s * dtheta * t_dot,
+                radius * c * dtheta * t_dot,
+                -sign * delta / T_half * t_dot,
+                omega_spin * t_dot)
+    return pos, vel
+
+
+helix = jit(_helix, static_argnames=("ctx",))
+
+
+# Sawtooth waypoints and per-segment differences, built once at import. The
+# wrap-around delta (last row) is never selected because segment_idx is
+# clipped to num_segments - 1.
+_SAWTOOTH_POINTS = jnp.array([
+    [0.0, 0.0], [0.0, 0.4], [0.4, -0.4], [0.4, 0.4], [0.4, -0.4],
+    [0.0, 0.4], [0.0, -0.4], [-0.4, 0.4], [-0.4, -0.4],
+    [-0.4, 0.4], [0.0, -0.4], [0.0, 0.0]
+], dtype=FLOAT_DTYPE)
+_SAWTOOTH_DELTA = jnp.roll(_SAWTOOTH_POINTS, -1, axis=0) - _SAWTOOTH_POINTS
+
+
+@partial(jax.custom_jvp, nondiff_argnums=(1,))
+def _sawtooth(t: float, ctx: TrajContext) -> jnp.ndarray:
     """Returns sawtooth pattern trajectory position (waypoint-based).
 
     Args:
@@ -307,47 +459,72 @@ def sawtooth(t: float, ctx: TrajContext) -> jnp.ndarray:
     height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
     flight_time = 120.0
     num_repeats = 2 if ctx.double_speed else 1
-    period_spin = 30.0
 
-    omega_spin = 2 * jnp.pi / period_spin if ctx.spin else 0.0
-
-    # Waypoints
-    points = jnp.array([
-        [0.0, 0.0], [0.0, 0.4], [0.4, -0.4], [0.4, 0.4], [0.4, -0.4],
-        [0.0, 0.4], [0.0, -0.4], [-0.4, 0.4], [-0.4, -0.4],
-        [-0.4, 0.4], [0.0, -0.4], [0.0, 0.0]
-    ], dtype=jnp.float64)
+    omega_spin = _OMEGA_SPIN_30 if ctx.spin else 0.0
 
     # Adjust flight time based on number of repetitions
     adjusted_flight_time = flight_time / num_repeats
-    num_segments = len(points) - 1
+    num_segments = len(_SAWTOOTH_POINTS) - 1
     T_seg = adjusted_flight_time / num_segments
 
-    # Calculate time within current cycle
-    cycle_time = t % (num_segments * T_seg)
-
-    # Determine segment index (continuous)
-    segment_idx = jnp.floor(cycle_time / T_seg)
-    segment_idx = jnp.clip(segment_idx, 0, num_segments - 1).astype(int)
+    # Segment index and within-segment fraction from one scaled variable;
+    # truncation gives the floor since the mod result is non-negative.
+    wrapped = jnp.mod(t / T_seg, num_segments)
+    segment_idx = jnp.minimum(wrapped.astype(jnp.int32), num_segments - 1)
+    alpha = wrapped - segment_idx
 
-    # Time within the current segment
-    local_time = cycle_time - segment_idx * T_seg
+    # Linear interpolation: one gather for the start point, one for the delta
+    start_point = _SAWTOOTH_POINTS[segment_idx]
+    delta = _SAWTOOTH_DELTA[segment_idx]
 
-    # Linear interpolation
-    start_point = points[segment_idx]
-    end_point = points[(segment_idx + 1) % len(points)]
-
-    alpha = local_time / T_seg
-    x = start_point[0] + (end_point[0] - start_point[0]) * alpha
-    y = start_point[1] + (end_point[1] - start_point[1]) * alpha
+    x = start_point[..., 0] + delta[..., 0] * alpha
+    y = start_point[..., 1] + delta[..., 1] * alpha
     z = -height
     yaw = omega_spin * t
 
-    return jnp.array([x, y, z, yaw], dtype=jnp.float64)
+    return _pack(x, y, z, yaw)
 
 
-@jit(static_argnames=("ctx",))
-def triangle(t: float, ctx: TrajContext) -> jnp.ndarray:
+@_sawtooth.defjvp
+def _sawtooth_jvp(ctx, primals, tangents):
+    """Analytic tangent for sawtooth: constant slope within each segment."""
+    (t,), (t_dot,) = primals, tangents
+    flight_time = 120.0
+    num_repeats = 2 if ctx.double_speed else 1
+    omega_spin = _OMEGA_SPIN_30 if ctx.spin else 0.0
+
+    num_segments = len(_SAWTOOTH_POINTS) - 1
+    T_seg = flight_time / num_repeats / num_segments
+
+    wrapped = jnp.mod(t / T_seg, num_segments)
+    segment_idx = jnp.minimum(wrapped.astype(jnp.int32), num_segments - 1)
+
+    delta = _SAWTOOTH_DELTA[segment_idx]
+    pos = _sawtooth(t, ctx)
+    vel = _pack(delta[..., 0] / T_seg * t_dot,
+                delta[..., 1] / T_seg * t_dot,
+                0.0 * t_dot,
+                omega_spin * t_dot)
+    return pos, vel
+
+
+sawtooth = jit(_sawtooth, static_argnames=("ctx",))
+
+
+# Equilateral triangle vertices and per-side differences, built once at
+# import. _TRIANGLE_DELTA wraps around, so no modulo gather is needed.
+_TRIANGLE_SIDE = 0.8
+_TRIANGLE_H = math.sqrt(_TRIANGLE_SIDE**2 - (_TRIANGLE_SIDE/2)**2)
+_TRIANGLE_POINTS = jnp.array([
+    [0.0, _TRIANGLE_H/2],
+    [_TRIANGLE_SIDE/2, -_TRIANGLE_H/2],
+    [-_TRIANGLE_SIDE/2, -_TRIANGLE_H/2]
+], dtype=FLOAT_DTYPE)
+_TRIANGLE_DELTA = jnp.roll(_TRIANGLE_POINTS, -1, axis=0) - _TRIANGLE_POINTS
+
+
+@partial(jax.custom_jvp, nondiff_argnums=(1,))
+def _triangle(t: float, ctx: TrajContext) -> jnp.ndarray:
     """Returns equilateral triangle trajectory position (waypoint-based).
 
     Args:
@@ -358,45 +535,55 @@ def triangle(t: float, ctx: TrajContext) -> jnp.ndarray:
         Position array [x, y, z, yaw]
     """
     height = HARDWARE_HEIGHT if not ctx.sim else SIM_HEIGHT
-    side_length = 0.8
     flight_time = 60.0
     num_repeats = 2 if ctx.double_speed else 1
-    period_spin = 20.0
-
-    omega_spin = 2 * jnp.pi / period_spin if ctx.spin else 0.0
 
-    # Triangle vertices
-    h = jnp.sqrt(side_length**2 - (side_length/2)**2)
-    points = jnp.array([
-        [0.0, h/2],
-        [side_length/2, -h/2],
-        [-side_length/2, -h/2]
-    ], dtype=jnp.float64)
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
 
     # Calculate segment time
     T_seg = flight_time / (3 * num_repeats)
 
-    # Calculate time within current cycle
-    cycle_time = t % (3 * T_seg)
-
-    # Determine segment index
-    segment_idx = jnp.floor(cycle_time / T_seg)
-    segment_idx = jnp.clip(segment_idx, 0, 2).astype(int)
-
-    # Time within the current segment
-    local_time = cycle_time - segment_idx * T_seg
+    # Segment index and within-segment fraction from one scaled variable;
+    # truncation gives the floor since the mod result is non-negative.
+    wrapped = jnp.mod(t / T_seg, 3)
+    segment_idx = jnp.minimum(wrapped.astype(jnp.int32), 2)
+    alpha = wrapped - segment_idx
 
-    # Linear interpolation
-    start_point = points[segment_idx]
-    end_point = points[(segment_idx + 1) % 3]
+    # Linear interpolation: one gather for the start point, one for the delta
+    start_point = _TRIANGLE_POINTS[segment_idx]
+    delta = _TRIANGLE_DELTA[segment_idx]
 
-    alpha = local_time / T_seg
-    x = start_point[0] + (end_point[0] - start_point[0]) * alpha
-    y = start_point[1] + (end_point[1] - start_point[1]) * alpha
+    x = start_point[..., 0] + delta[..., 0] * alpha
+    y = start_point[..., 1] + delta[..., 1] * alpha
     z = -height
     yaw = omega_spin * t
 
-    return jnp.array([x, y, z, yaw], dtype=jnp.float64)
+    return _pack(x, y, z, yaw)
+
+
+@_triangle.defjvp
+def _triangle_jvp(ctx, primals, tangents):
+    """Analytic tangent for triangle: constant slope along each side."""
+    (t,), (t_dot,) = primals, tangents
+    flight_time = 60.0
+    num_repeats = 2 if ctx.double_speed else 1
+    omega_spin = _OMEGA_SPIN_20 if ctx.spin else 0.0
+
+    T_seg = flight_time / (3 * num_repeats)
+    wrapped = jnp.mod(t / T_seg, 3)
+    segment_idx = jnp.minimum(wrapped.astype(jnp.int32), 2)
+
+    delta = _TRIANGLE_DELTA[segment_idx]
+    pos = _triangle(t, ctx)
+    vel = _pack(delta[..., 0] / T_seg * t_dot,
+                delta[..., 1] / T_seg * t_dot,
+                0.0 * t_dot,
+                omega_spin * t_dot)
+    return pos, vel
+
+
+triangle = jit(_triangle, static_argnames=("ctx",))
+
 
 @jit(static_argnames=("ctx",))
 def fig8_contraction(t: float, ctx: TrajContext) -> jnp.ndarray:
@@ -412,7 +599,7 @@ def fig8_contraction(t: float, ctx: TrajContext) -> jnp.ndarray:
     pz = -height
     psi = 0.0
 
-    return jnp.array([px, py, pz, psi], dtype=jnp.float64)
+    return _pack(px, py, pz, psi)
 
 
 @jit(static_argnames=("ctx",))
@@ -430,7 +617,7 @@ def fig8_heading_contraction(t: float, ctx: TrajContext) -> jnp.ndarray:
     pz = -height
     psi = jnp.arctan2(jnp.cos(2 * s), jnp.cos(s))
 
-    return jnp.array([px, py, pz, psi], dtype=jnp.float64)
+    return _pack(px, py, pz, psi)
 
 
 @jit(static_argnames=("ctx",))
@@ -464,7 +651,7 @@ def spiral_contraction(t: float, ctx: TrajContext) -> jnp.ndarray:
     pz = -z_height
     psi = 0.0
 
-    return jnp.array([px, py, pz, psi], dtype=jnp.float64)
+    return _pack(px, py, pz, psi)
 
 
 @jit(static_argnames=("ctx",))
@@ -486,4 +673,4 @@ def trefoil_contraction(t: float, ctx: TrajContext) -> jnp.ndarray:
     pz = -(h_mid + h_amp * jnp.sin(3 * s))
     psi = 0.0
 
-    return jnp.array([px, py, pz, psi], dtype=jnp.float64)
+    return _pack(px, py, pz, psi)
@@ -1,12 +1,28 @@
 """JAX configuration and utilities for trajectory generation."""
 
+import os
+
 import jax
+import jax.numpy as jnp
+
+# Trajectory references only need FP32 accuracy (sub-millimeter at workspace
+# scale), and FP64 is substantially slower on accelerators. Float64 is
+# opt-in: set QUAD_TRAJ_FP64=1 to enable x64 and carry float64 throughout.
+if os.environ.get("QUAD_TRAJ_FP64", "0") == "1":
+    jax.config.update("jax_enable_x64", True)
+    FLOAT_DTYPE = jnp.float64
+else:
+    FLOAT_DTYPE = jnp.float32
 
+# Optional backend override (e.g. "cpu" to pin tiny functions where dispatch
+# latency dominates). Unset means jax.jit picks the default device, so
+# controllers already running on an accelerator avoid a host round-trip.
+_BACKEND = os.environ.get("QUAD_TRAJ_BACKEND")
 
 
 def jit(fun=None, **kwargs):
-    """Wrapper around jax.jit that sets backend=cpu by default."""
-    kwargs.setdefault("backend", "cpu")
+    """Wrapper around jax.jit honoring the QUAD_TRAJ_BACKEND env var."""
+    kwargs.setdefault("backend", _BACKEND)
     if fun is None:
         # Called like @jit(...)
         return lambda f: jax.jit(f, **kwargs)
@@ -1,9 +1,13 @@
 """Trajectory registry mapping TrajectoryType to trajectory functions."""
 
-from typing import Callable, Dict
+from typing import Callable, Dict, NamedTuple
+
+import jax
 import jax.numpy as jnp
 
 from .types import TrajectoryType, TrajContext
+from .jax_utils import jit, FLOAT_DTYPE
+from .utils import get_velocity_fn, get_acceleration_fn
 from .core import (
     hover,
     hover_contraction,
@@ -41,3 +45,65 @@ TRAJ_REGISTRY: Dict[TrajectoryType, TrajectoryFunc] = {
     TrajectoryType.SPIRAL_CONTRACTION: spiral_contraction,
     TrajectoryType.TREFOIL_CONTRACTION: trefoil_contraction,
 }
+
+
+def bind_ctx(
+    traj_fn: TrajectoryFunc,
+    ctx: TrajContext,
+) -> Callable[[float], jnp.ndarray]:
+    """Binds ctx once, returning a jitted (t) -> [x, y, z, yaw] function.
+
+    The returned function has no static arguments, so each call takes jit's
+    fast dispatch path instead of re-hashing ctx through the static_argnames
+    machinery. Controllers reusing one ctx for thousands of calls should
+    bind once and hold onto the result across timesteps.
+
+    Args:
+        traj_fn: Position-only trajectory function (t, ctx) -> [x, y, z, yaw]
+        ctx: Trajectory context to bind
+
+    Returns:
+        Function (t) -> [x, y, z, yaw]
+    """
+    return jit(jax.tree_util.Partial(lambda t: traj_fn(t, ctx)))
+
+
+class CompiledTrajectory(NamedTuple):
+    """AOT-compiled position/velocity/acceleration functions bound to a ctx.
+
+    Each field is an XLA executable taking only the time argument, which must
+    match the shape and dtype of the example time used at compile time.
+    """
+    pos: Callable[[float], jnp.ndarray]
+    vel: Callable[[float], jnp.ndarray]
+    accel: Callable[[float], jnp.ndarray]
+
+
+def build_compiled_registry(
+    ctx: TrajContext,
+    t_example: float = 0.0,
+) -> Dict[TrajectoryType, CompiledTrajectory]:
+    """Ahead-of-time compiles every trajectory for the given context.
+
+    Compiling at startup moves the first-call JIT stall out of the control
+    loop: the returned executables hit compiled code on their first
+    invocation.
+
+    Args:
+        ctx: Trajectory context to specialize every trajectory for
+        t_example: Example time fixing the shape/dtype of the compiled
+            time argument (pass an array to compile for batched time)
+
+    Returns:
+        Dict mapping TrajectoryType to CompiledTrajectory executables
+    """
+    t_example = jnp.asarray(t_example, dtype=FLOAT_DTYPE)
+
+    compiled: Dict[TrajectoryType, CompiledTrajectory] = {}
+    for traj_type, traj_fn in TRAJ_REGISTRY.items():
+        compiled[traj_type] = CompiledTrajectory(
+            pos=traj_fn.lower(t_example, ctx).compile(),
+            vel=get_velocity_fn(traj_fn, ctx).lower(t_example).compile(),
+            accel=get_acceleration_fn(traj_fn, ctx).lower(t_example).compile(),
+        )
+    return compiled
@@ -4,6 +4,8 @@ import enum
 from dataclasses import dataclass
 from typing import Optional
 
+import jax
+
 try:
     # Python 3.11+
     from enum import StrEnum  # type: ignore[attr-defined]
@@ -18,6 +20,11 @@ except ImportError:
 class TrajContext:
     """Context object containing trajectory parameters.
 
+    This is the *static* half of the trajectory context: every field is a
+    flag consumed by Python-level control flow, so it stays hashable and is
+    passed through static_argnames. Numeric parameters that should be traced
+    instead of recompiled over belong in TrajDynamicCtx.
+
     Attributes:
         sim: Whether running in simulation (True) or on hardware (False).
              Affects default heights and available modes.
@@ -32,6 +39,49 @@ class TrajContext:
     double_speed: Optional[bool] = None
     short: Optional[bool] = None
 
+    def __post_init__(self) -> None:
+        # Validate at construction so the trajectory functions stay pure
+        # table lookups and traces are never retained for invalid combos.
+        if self.hover_mode is not None:
+            if not 1 <= self.hover_mode <= 8:
+                raise ValueError(f"hover_dict #{self.hover_mode} not found")
+            if self.hover_mode > 4 and not self.sim:
+                raise RuntimeError("hover modes 5+ not available for hardware")
+
+
+# Registered as a pytree with every flag in the aux data and no array leaves:
+# a ctx can then ride through vmap/pmap/tree_util.Partial wrappers as part of
+# the tree structure while traces still specialize on its flags.
+jax.tree_util.register_pytree_node(
+    TrajContext,
+    lambda ctx: ((), (ctx.sim, ctx.hover_mode, ctx.spin, ctx.double_speed, ctx.short)),
+    lambda aux, children: TrajContext(*aux),
+)
+
+
+# Alias making the static/dynamic split explicit at call sites.
+TrajStaticCtx = TrajContext
+
+
+@jax.tree_util.register_pytree_node_class
+@dataclass(frozen=True)
+class TrajDynamicCtx:
+    """Traced numeric trajectory parameters.
+
+    Counterpart to the static TrajContext: fields added here flow through
+    JIT as regular array data, so sweeping them (e.g. a radius or period)
+    reuses the compiled trace instead of triggering a recompile. Currently
+    empty — reserved for future numeric parameters.
+    """
+
+    def tree_flatten(self):
+        return (), None
+
+    @classmethod
+    def tree_unflatten(cls, aux_data, children):
+        del aux_data, children
+        return cls()
+
 
 class TrajectoryType(StrEnum):
     """Enumeration of available trajectories."""
@@ -4,23 +4,29 @@ These utilities help controllers compute derivatives and generate
 trajectory samples over prediction horizons.
 """
 
+import functools
 from typing import Callable, Tuple
+
 import jax
 import jax.numpy as jnp
 from jax import jacfwd, vmap
 
 from .types import TrajContext
-from .jax_utils import jit
+from .jax_utils import jit, FLOAT_DTYPE
 
 GRAVITY: float = 9.81
 
 
+@functools.lru_cache(maxsize=None)
 def get_velocity_fn(
     traj_fn: Callable[[float, TrajContext], jnp.ndarray],
     ctx: TrajContext
 ) -> Callable[[float], jnp.ndarray]:
     """Returns a JIT-compiled velocity function for the given trajectory.
 
+    Memoized per (traj_fn, ctx) pair: controllers calling this every
+    timestep get the same compiled closure back instead of a fresh one.
+
     Args:
         traj_fn: Position-only trajectory function (t, ctx) -> [x, y, z, yaw]
         ctx: Trajectory context
@@ -30,16 +36,21 @@ def get_velocity_fn(
     """
     @jit
     def vel_fn(t: float) -> jnp.ndarray:
-        return jacfwd(lambda t_: traj_fn(t_, ctx))(t)
+        # Scalar input: a single JVP against a unit tangent gives the full
+        # derivative without jacfwd's Jacobian-assembly machinery.
+        return jax.jvp(lambda t_: traj_fn(t_, ctx), (t,), (jnp.ones_like(t),))[1]
     return vel_fn
 
 
+@functools.lru_cache(maxsize=None)
 def get_acceleration_fn(
     traj_fn: Callable[[float, TrajContext], jnp.ndarray],
     ctx: TrajContext
 ) -> Callable[[float], jnp.ndarray]:
     """Returns a JIT-compiled acceleration function for the given trajectory.
 
+    Memoized per (traj_fn, ctx) pair, like get_velocity_fn.
+
     Args:
         traj_fn: Position-only trajectory function (t, ctx) -> [x, y, z, yaw]
         ctx: Trajectory context
@@ -49,16 +60,21 @@ def get_acceleration_fn(
     """
     @jit
     def accel_fn(t: float) -> jnp.ndarray:
-        return jacfwd(jacfwd(lambda t_: traj_fn(t_, ctx)))(t)
+        def vel(t_: float) -> jnp.ndarray:
+            return jax.jvp(lambda s: traj_fn(s, ctx), (t_,), (jnp.ones_like(t_),))[1]
+        return jax.jvp(vel, (t,), (jnp.ones_like(t),))[1]
     return accel_fn
 
 
+@functools.lru_cache(maxsize=None)
 def get_pos_vel_fn(
     traj_fn: Callable[[float, TrajContext], jnp.ndarray],
     ctx: TrajContext
 ) -> Callable[[float], Tuple[jnp.ndarray, jnp.ndarray]]:
     """Returns a JIT-compiled function that returns both position and velocity.
 
+    Memoized per (traj_fn, ctx) pair, like get_velocity_fn.
+
     Args:
         traj_fn: Position-only trajectory function (t, ctx) -> [x, y, z, yaw]
         ctx: Trajectory context
@@ -68,13 +84,13 @@ def get_pos_vel_fn(
     """
     @jit
     def pos_vel_fn(t: float) -> Tuple[jnp.ndarray, jnp.ndarray]:
-        pos = traj_fn(t, ctx)
-        vel = jacfwd(lambda t_: traj_fn(t_, ctx))(t)
-        return pos, vel
+        # jvp returns (primal, tangent) from one forward pass, so the
+        # position is not evaluated a second time for the velocity.
+        return jax.jvp(lambda t_: traj_fn(t_, ctx), (t,), (jnp.ones_like(t),))
     return pos_vel_fn
 
 
-@jit
+@jit(static_argnames=("traj_fn", "ctx", "num_steps"))
 def generate_horizon_positions(
     traj_fn: Callable[[float, TrajContext], jnp.ndarray],
     ctx: TrajContext,
@@ -94,14 +110,15 @@ def generate_horizon_positions(
     Returns:
         Array of shape (num_steps, 4) with positions [x, y, z, yaw]
     """
-    if num_steps == 1:
-        t_samples = jnp.array([t_start], dtype=jnp.float64)
-    else:
-        t_samples = jnp.linspace(t_start, t_start + horizon, num_steps, dtype=jnp.float64)
-
-    return vmap(lambda t: traj_fn(t, ctx))(t_samples)
+    # num_steps is static, so linspace gets a concrete length (num_steps == 1
+    # yields just [t_start], matching the old special case). The trajectory
+    # bodies are elementwise in t, so the sample vector goes straight in —
+    # no vmap wrapper to retrace.
+    t_samples = jnp.linspace(t_start, t_start + horizon, num_steps, dtype=FLOAT_DTYPE)
+    return traj_fn(t_samples, ctx)
 
 
+@jit(static_argnames=("traj_fn", "ctx", "num_steps"))
 def generate_horizon_with_velocity(
     traj_fn: Callable[[float, TrajContext], jnp.ndarray],
     ctx: TrajContext,
@@ -124,45 +141,120 @@ def generate_horizon_with_velocity(
     if num_steps <= 0:
         raise ValueError("num_steps must be >= 1")
 
-    if num_steps == 1:
-        t_samples = jnp.array([t_start], dtype=jnp.float64)
-    else:
-        t_samples = jnp.linspace(t_start, t_start + horizon, num_steps, dtype=jnp.float64)
-
-    def one_sample(t: float) -> Tuple[jnp.ndarray, jnp.ndarray]:
-        pos = traj_fn(t, ctx)
-        vel = jacfwd(lambda t_: traj_fn(t_, ctx))(t)
-        return pos, vel
+    t_samples = jnp.linspace(t_start, t_start + horizon, num_steps, dtype=FLOAT_DTYPE)
 
-    positions, velocities = vmap(one_sample)(t_samples)
+    # One jvp over the whole sample vector: the trajectories are elementwise
+    # in t, so this yields (num_steps, 4) positions and velocities at once.
+    positions, velocities = jax.jvp(
+        lambda ts: traj_fn(ts, ctx), (t_samples,), (jnp.ones_like(t_samples),))
     return positions, velocities
 
 
-def generate_reference_trajectory(
-    traj_func: Callable[[float, TrajContext], jnp.ndarray],
+@jit(static_argnames=("traj_fn", "ctx", "num_steps"))
+def generate_horizon_positions_scan(
+    traj_fn: Callable[[float, TrajContext], jnp.ndarray],
+    ctx: TrajContext,
     t_start: float,
     horizon: float,
-    num_steps: int,
-    ctx: TrajContext
+    num_steps: int
+) -> jnp.ndarray:
+    """Generate position samples over a horizon with a lax.scan loop.
+
+    Same result as generate_horizon_positions, but the compiled program
+    size stays O(1) in num_steps: use for very large horizons where the
+    batched form is slow to compile or memory-heavy.
+
+    Args:
+        traj_fn: Position-only trajectory function
+        ctx: Trajectory context
+        t_start: Starting time (seconds)
+        horizon: Prediction horizon length (seconds)
+        num_steps: Number of discretization steps (>=1)
+
+    Returns:
+        Array of shape (num_steps, 4) with positions [x, y, z, yaw]
+    """
+    t_samples = jnp.linspace(t_start, t_start + horizon, num_steps, dtype=FLOAT_DTYPE)
+
+    def step(carry, t):
+        return carry, traj_fn(t, ctx)
+
+    _, positions = jax.lax.scan(step, None, t_samples)
+    return positions
+
+
+@jit(static_argnames=("traj_fn", "ctx", "num_steps"))
+def generate_horizon_with_velocity_scan(
+    traj_fn: Callable[[float, TrajContext], jnp.ndarray],
+    ctx: TrajContext,
+    t_start: float,
+    horizon: float,
+    num_steps: int
 ) -> Tuple[jnp.ndarray, jnp.ndarray]:
+    """Generate position and velocity samples over a horizon with lax.scan.
+
+    Scan counterpart of generate_horizon_with_velocity: one jvp per step
+    inside the loop body, with program size independent of num_steps.
+
+    Returns:
+        Tuple of (positions, velocities), each of shape (num_steps, 4)
     """
-    Generate reference trajectory for a prediction horizon.
+    t_samples = jnp.linspace(t_start, t_start + horizon, num_steps, dtype=FLOAT_DTYPE)
 
-    This function provides compatibility with the original newton_raphson_enhanced
-    interface. It is equivalent to generate_horizon_with_velocity but with
-    arguments in the original order.
+    def step(carry, t):
+        pos, vel = jax.jvp(lambda t_: traj_fn(t_, ctx), (t,), (jnp.ones_like(t),))
+        return carry, (pos, vel)
+
+    _, (positions, velocities) = jax.lax.scan(step, None, t_samples)
+    return positions, velocities
+
+
+def generate_horizon_batch(
+    traj_fn: Callable[[float, TrajContext], jnp.ndarray],
+    ctx: TrajContext,
+    t_starts: jnp.ndarray,
+    horizon: float,
+    num_steps: int
+) -> jnp.ndarray:
+    """Generate position horizons for a batch of start times (e.g. a fleet).
+
+    The trajectories are stateless, so batch members are independent: when
+    the batch divides evenly across the local devices the work is spread
+    with pmap, otherwise it runs as a single-device vmap.
 
     Args:
-        traj_func: Trajectory function that returns position [x, y, z, yaw]
-        t_start: Starting time for trajectory (seconds)
+        traj_fn: Position-only trajectory function
+        ctx: Trajectory context shared by the batch
+        t_starts: Starting times, shape (batch,)
         horizon: Prediction horizon length (seconds)
         num_steps: Number of discretization steps (>=1)
-        ctx: Trajectory context
 
     Returns:
-        Tuple of (positions, velocities), each of shape (num_steps, 4)
+        Array of shape (batch, num_steps, 4) with positions [x, y, z, yaw]
     """
-    return generate_horizon_with_velocity(traj_func, ctx, t_start, horizon, num_steps)
+    t_starts = jnp.asarray(t_starts, dtype=FLOAT_DTYPE)
+
+    def one_horizon(t0: float) -> jnp.ndarray:
+        return generate_horizon_positions(traj_fn, ctx, t0, horizon, num_steps)
+
+    batch = t_starts.shape[0]
+    num_devices = jax.local_device_count()
+    if num_devices > 1 and batch % num_devices == 0:
+        sharded = t_starts.reshape(num_devices, batch // num_devices)
+        out = jax.pmap(vmap(one_horizon))(sharded)
+        return out.reshape(batch, num_steps, 4)
+
+    return vmap(one_horizon)(t_starts)
+
+
+# Compatibility alias preserving the original newton_raphson_enhanced argument
+# order (traj_func, t_start, horizon, num_steps, ctx). A bare delegation keeps
+# it on generate_horizon_with_velocity's compilation cache; prefer calling
+# that function directly in new code.
+generate_reference_trajectory = (
+    lambda traj_func, t_start, horizon, num_steps, ctx:
+        generate_horizon_with_velocity(traj_func, ctx, t_start, horizon, num_steps)
+)
 
 
 def flat_to_x_u(
@@ -230,9 +322,9 @@ def generate_feedforward_trajectory(
         u_ff_traj: shape (num_steps,  4) – [df, dphi, dth, dpsi]
     """
     if num_steps == 1:
-        t_samples = jnp.array([t_start], dtype=jnp.float64)
+        t_samples = jnp.array([t_start], dtype=FLOAT_DTYPE)
     else:
-        t_samples = jnp.linspace(t_start, t_start + horizon, num_steps, dtype=jnp.float64)
+        t_samples = jnp.linspace(t_start, t_start + horizon, num_steps, dtype=FLOAT_DTYPE)
 
     flat_output = lambda t: traj_fn(t, ctx)
     one_sample = lambda t: flat_to_x_u(t, flat_output)